@@ -32,16 +32,10 @@ class RecipeFilterSet(FilterSet):
 
     def get_is_favorited(self, queryset, name, value):
         if value and self.request.user.is_authenticated:
-            return queryset.filter(
-                favorite__user=self.request.user,
-                is_favorited=True,
-            )
+            return queryset.filter(is_favorited=True)
         return queryset
 
     def get_is_in_shopping_cart(self, queryset, name, value):
         if value and self.request.user.is_authenticated:
-            return queryset.filter(
-                shopping_cart__user=self.request.user,
-                is_in_shopping_cart=True,
-            )
+            return queryset.filter(is_in_shopping_cart=True)
         return queryset
@@ -7,18 +7,27 @@ from recipes.models import Ingredient
 
 DATA_PATH = os.path.join(settings.BASE_DIR, 'data')
 INGREDIENTS_DATA = os.path.join(DATA_PATH, 'ingredients.csv')
+BATCH_SIZE = 1000
 
 
 class Command(BaseCommand):
     """Импортирует данные из .csv в базу данных"""
 
     def handle(self, *args, **kwargs):
+        ingredients_list = []
         with open(INGREDIENTS_DATA, 'r', encoding='UTF-8') as ingredients:
             for fields in reader(ingredients):
                 if len(fields) == 2:
                     name, measurement_unit = fields
-                    Ingredient.objects.get_or_create(
-                        name=name,
-                        measurement_unit=measurement_unit,
+                    ingredients_list.append(
+                        Ingredient(
+                            name=name,
+                            measurement_unit=measurement_unit,
+                        )
                     )
+        Ingredient.objects.bulk_create(
+            ingredients_list,
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
         self.stdout.write('Данные успешно импортированы')
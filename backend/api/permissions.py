@@ -10,8 +10,7 @@ class AuthorOrAdminOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         return (request.method in permissions.SAFE_METHODS
                 or obj.author == request.user
-                or request.user.is_admin
-                or request.user.is_staff)
+                or request.user.is_admin)
 
 
 class AdminOrReadOnly(permissions.BasePermission):
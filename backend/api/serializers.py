@@ -1,13 +1,13 @@
 from django.contrib.auth.password_validation import validate_password
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db import transaction
+from django.db.models import Manager
 
 from djoser.serializers import UserCreateSerializer, UserSerializer
 from drf_extra_fields.fields import Base64ImageField
 from rest_framework import serializers
-from rest_framework.validators import UniqueTogetherValidator
 
-from recipes.models import (Ingredient, IngredientAmount, Recipe, Tag,
-                            Favorite, ShoppingCart)
+from recipes.models import Ingredient, IngredientAmount, Recipe, Tag
 from users.models import User
 from api.params import (MIN_COOKING_TIME,
                         MAX_COOKING_TIME,
@@ -122,6 +122,21 @@ class TagSerializer(serializers.ModelSerializer):
         read_only_fields = '__all__',
 
 
+class IngredientAmountListSerializer(serializers.ListSerializer):
+    """
+    Выводит ингредиенты рецепта от последнего добавленного к первому.
+    Сортирует уже загруженные записи, не делая запрос к базе данных.
+    """
+
+    def to_representation(self, data):
+        ingredients = sorted(
+            data.all() if isinstance(data, Manager) else data,
+            key=lambda ingredient: ingredient.id,
+            reverse=True,
+        )
+        return super().to_representation(ingredients)
+
+
 class IngredientAmountSerializer(serializers.ModelSerializer):
     """Сериализатор для работы с количеством ингредиентов в рецепте."""
     id = serializers.PrimaryKeyRelatedField(
@@ -149,6 +164,7 @@ class IngredientAmountSerializer(serializers.ModelSerializer):
     class Meta:
         model = IngredientAmount
         fields = ('id', 'name', 'measurement_unit', 'amount')
+        list_serializer_class = IngredientAmountListSerializer
 
 
 class RecipeSerializer(serializers.ModelSerializer):
@@ -245,7 +261,7 @@ class FollowSerializer(serializers.ModelSerializer):
         Выводит список рецептов авторов, на которых подписан текущий
         пользователь.
         """
-        recipes = obj.recipes.all()
+        recipes = obj.recipes.with_related()
         serializer = RecipeSerializer(recipes, many=True, read_only=True)
         return serializer.data
 
@@ -275,18 +291,20 @@ class RecipeCreateSerializer(RecipeSerializer):
 
     @staticmethod
     def save_ingredients(recipe, ingredients):
-        ingredients_list = []
-        for ingredient in ingredients:
-            current_ingredient = ingredient['ingredient']['id']
-            current_amount = ingredient.get('amount')
-            ingredients_list.append(
-                IngredientAmount(
-                    recipe=recipe,
-                    ingredient=current_ingredient,
-                    amount=current_amount
-                )
-            )
-        IngredientAmount.objects.bulk_create(ingredients_list)
+        IngredientAmount.bulk_set_for_recipe(
+            recipe,
+            [(ingredient['ingredient']['id'], ingredient.get('amount'))
+             for ingredient in ingredients]
+        )
+
+    @staticmethod
+    def save_tags(recipe, tags):
+        through = Recipe.tags.through
+        through.objects.filter(recipe=recipe).delete()
+        through.objects.bulk_create(
+            [through(recipe=recipe, tag=tag) for tag in tags],
+            ignore_conflicts=True,
+        )
 
     def validate(self, data):
         ingredients_list = []
@@ -303,15 +321,17 @@ class RecipeCreateSerializer(RecipeSerializer):
             )
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         author = self.context.get('request').user
         ingredients = validated_data.pop('ingredients_amount')
         tags = validated_data.pop('tags')
         recipe = Recipe.objects.create(**validated_data, author=author)
-        recipe.tags.add(*tags)
+        self.save_tags(recipe, tags)
         self.save_ingredients(recipe, ingredients)
         return recipe
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         instance.name = validated_data.get('name', instance.name)
         instance.text = validated_data.get('text', instance.text)
@@ -322,58 +342,10 @@ class RecipeCreateSerializer(RecipeSerializer):
         )
         ingredients = validated_data.pop('ingredients_amount')
         tags = validated_data.pop('tags')
-        instance.tags.clear()
-        instance.ingredients.clear()
-        instance.tags.add(*tags)
+        self.save_tags(instance, tags)
         self.save_ingredients(instance, ingredients)
         instance.save()
         return instance
 
     def to_representation(self, instance):
         return RecipeSerializer(instance, context=self.context).data
-
-
-class FavoriteSerializer(RecipeShortSerializer):
-    """Сериализатор для работы со списком избранного."""
-    user = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        write_only=True,
-    )
-    recipe = serializers.PrimaryKeyRelatedField(
-        queryset=Recipe.objects.all(),
-        write_only=True,
-    )
-
-    class Meta:
-        model = Favorite
-        fields = ('user', 'recipe')
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Favorite.objects.all(),
-                fields=('user', 'recipe'),
-                message='Рецепт уже был добавлен в избранное'
-            )
-        ]
-
-
-class ShoppingCartSerializer(RecipeShortSerializer):
-    """Сериализатор для работы со списком покупок."""
-    user = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        write_only=True,
-    )
-    recipe = serializers.PrimaryKeyRelatedField(
-        queryset=Recipe.objects.all(),
-        write_only=True,
-    )
-
-    class Meta:
-        model = ShoppingCart
-        fields = ('user', 'recipe')
-        validators = [
-            UniqueTogetherValidator(
-                queryset=ShoppingCart.objects.all(),
-                fields=('user', 'recipe'),
-                message='Рецепт уже был добавлен в список покупок'
-            )
-        ]
@@ -1,7 +1,7 @@
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import F, Sum
+from django.db import IntegrityError, transaction
 
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -19,9 +19,7 @@ from .serializers import (
                         TagSerializer,
                         RecipeSerializer,
                         RecipeShortSerializer,
-                        RecipeCreateSerializer,
-                        FavoriteSerializer,
-                        ShoppingCartSerializer
+                        RecipeCreateSerializer
 )
 from .permissions import AuthorOrAdminOrReadOnly, AdminOrReadOnly
 from users.models import Follow, User
@@ -123,6 +121,10 @@ class TagsViewSet(mixins.ListModelMixin,
     permission_classes = (AdminOrReadOnly,)
     pagination_class = None
 
+    def list(self, request, *args, **kwargs):
+        serializer = self.get_serializer(Tag.all_cached(), many=True)
+        return Response(serializer.data)
+
 
 class IngredientsViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -162,8 +164,22 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user_id = self.request.user.pk
-        return Recipe.objects.add_annotations(user_id).select_related(
-            'author').prefetch_related('ingredients', 'tags')
+        return Recipe.objects.add_annotations(user_id).with_related()
+
+    def add_recipe(self, model, request, pk, message):
+        """
+        Добавляет рецепт в избранное или список покупок. Повторное добавление
+        отсекается ограничением уникальности в базе данных.
+        """
+        recipe = get_object_or_404(Recipe, pk=pk)
+        try:
+            with transaction.atomic():
+                model.objects.create(user=request.user, recipe=recipe)
+        except IntegrityError:
+            return Response({'errors': message},
+                            status=status.HTTP_400_BAD_REQUEST)
+        serializer = self.get_serializer(recipe)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(
         detail=True,
@@ -172,16 +188,8 @@ class RecipeViewSet(viewsets.ModelViewSet):
     )
     def favorite(self, request, pk):
         """Добавляет рецепт в `избранное`."""
-        recipe = get_object_or_404(Recipe, pk=pk)
-        data = {
-            'user': request.user.pk,
-            'recipe': recipe.pk
-        }
-        serializer = FavoriteSerializer(data=data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        serializer = self.get_serializer(recipe)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return self.add_recipe(Favorite, request, pk,
+                               'Рецепт уже был добавлен в избранное')
 
     @favorite.mapping.delete
     def delete_favorite(self, request, pk):
@@ -198,16 +206,8 @@ class RecipeViewSet(viewsets.ModelViewSet):
     )
     def shopping_cart(self, request, pk):
         """Добавляет рецепт в список покупок."""
-        recipe = get_object_or_404(Recipe, pk=pk)
-        data = {
-            'user': request.user.pk,
-            'recipe': recipe.pk
-        }
-        serializer = ShoppingCartSerializer(data=data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        serializer = self.get_serializer(recipe)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return self.add_recipe(ShoppingCart, request, pk,
+                               'Рецепт уже был добавлен в список покупок')
 
     @shopping_cart.mapping.delete
     def delete_shopping_cart(self, request, pk):
@@ -226,21 +226,18 @@ class RecipeViewSet(viewsets.ModelViewSet):
         """Загружает файл *.txt со списком покупок. Считает сумму ингредиентов
          в рецептах выбранных для покупки. Возвращает текстовый файл со списком
          ингредиентов."""
-        ingredients = IngredientAmount.objects.filter(
-            recipe__shopping_cart__user=request.user).values(
-            name=F('ingredient__name'),
-            measurement_unit=F('ingredient__measurement_unit')).annotate(
-            amount=Sum('amount')
-        )
-        data = []
-        for ingredient in ingredients:
-            data.append(
-                f'{ingredient["name"]} - '
-                f'{ingredient["amount"]} '
-                f'{ingredient["measurement_unit"]}'
-            )
-        content = 'Список покупок:\n\n' + '\n'.join(data)
+        ingredients = IngredientAmount.objects.shopping_list(request.user)
+
+        def content():
+            yield 'Список покупок:\n\n'
+            for ingredient in ingredients.iterator(chunk_size=500):
+                yield (
+                    f'{ingredient["name"]} - '
+                    f'{ingredient["amount"]} '
+                    f'{ingredient["measurement_unit"]}\n'
+                )
+
         filename = 'shopping_cart.txt'
-        request = HttpResponse(content, content_type='text/plain')
-        request['Content-Disposition'] = f'attachment; filename={filename}'
-        return request
+        response = StreamingHttpResponse(content(), content_type='text/plain')
+        response['Content-Disposition'] = f'attachment; filename={filename}'
+        return response
@@ -45,13 +45,26 @@ class RecipeAdmin(admin.ModelAdmin):
     empty_value_display = os.getenv('VALUE_DISPLAY', '---')
 
     def count_favorites(self, obj):
-        return obj.favorite.count()
+        return obj.favorites_count
 
     count_favorites.short_description = "Добавлено в избранное"
+    count_favorites.admin_order_field = 'favorites_count'
+
+
+class UserRecipeAdminMixin:
+    """
+    Запрещает менять пользователя и рецепт у существующей записи:
+    счетчики рецептов учитывают только создание и удаление записей.
+    """
+
+    def get_readonly_fields(self, request, obj=None):
+        if obj is not None:
+            return ('user', 'recipe')
+        return ()
 
 
 @admin.register(Favorite)
-class FavoriteAdmin(admin.ModelAdmin):
+class FavoriteAdmin(UserRecipeAdminMixin, admin.ModelAdmin):
     """Отображает подписки на авторов в панели администратора."""
     list_display = ('user', 'recipe')
     search_fields = ('user',)
@@ -60,7 +73,7 @@ class FavoriteAdmin(admin.ModelAdmin):
 
 
 @admin.register(ShoppingCart)
-class ShoppingCartAdmin(admin.ModelAdmin):
+class ShoppingCartAdmin(UserRecipeAdminMixin, admin.ModelAdmin):
     """Отображает список покупок в панели администратора."""
     list_display = ('id', 'recipe', 'user')
     search_fields = ('user',)
@@ -73,3 +86,4 @@ class IngredientAmountAdmin(admin.ModelAdmin):
     """Отображает количество игредиентов в рецептах в панели администратора."""
     list_display = ('id', 'ingredient', 'recipe', 'amount')
     search_fields = ('recipe',)
+    ordering = ('-id',)
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.19 on 2026-10-15 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0003_auto_20261015_1210'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ingredientamount',
+            index=models.Index(fields=['recipe', 'ingredient'], name='amount_recipe_ingredient_idx'),
+        ),
+    ]
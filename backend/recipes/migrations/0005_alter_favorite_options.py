@@ -0,0 +1,17 @@
+# Generated by Django 3.2.19 on 2026-10-15 12:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0004_ingredientamount_amount_recipe_ingredient_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='favorite',
+            options={'ordering': ('-id',), 'verbose_name': 'Избранное', 'verbose_name_plural': 'Избранные'},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.19 on 2026-10-15 12:40
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0005_alter_favorite_options'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql='CREATE INDEX ingredient_upper_name_trgm_idx '
+                'ON recipes_ingredient '
+                'USING gin (UPPER(name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX ingredient_upper_name_trgm_idx;',
+        ),
+    ]
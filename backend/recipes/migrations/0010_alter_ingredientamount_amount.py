@@ -0,0 +1,19 @@
+# Generated by Django 3.2.19 on 2026-10-15 15:00
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0008_auto_20261015_1400'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='ingredientamount',
+            name='amount',
+            field=models.PositiveSmallIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1, 'Минимальное количество ингредиентов - 1 ед.'), django.core.validators.MaxValueValidator(32000, 'Максимальное количество ингредиентов - 32000 ед.')], verbose_name='Количество'),
+        ),
+    ]
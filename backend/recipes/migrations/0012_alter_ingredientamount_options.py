@@ -0,0 +1,17 @@
+# Generated by Django 3.2.19 on 2026-10-15 16:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0011_recipe_tags_tag_recipe_idx'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='ingredientamount',
+            options={'verbose_name': 'Ингредиент', 'verbose_name_plural': 'Ингредиенты рецепта'},
+        ),
+    ]
@@ -12,6 +12,9 @@ from api.params import (MIN_COOKING_TIME,
 
 models.CharField.register_lookup(Length)
 
+# Кэш таблицы тэгов в памяти процесса, сбрасывается сигналами модели Tag
+_TAG_CACHE = {}
+
 
 class Ingredient(models.Model):
     """Модель игредиентов."""
@@ -45,6 +48,8 @@ class Ingredient(models.Model):
                      'значение\n',
             ),
         )
+        # Триграммный индекс по UPPER(name) для поиска по началу названия
+        # создается в миграции 0006 через RunSQL.
 
     def __str__(self):
         return f'{self.name}, {self.measurement_unit}'
@@ -73,7 +78,6 @@ class Tag(models.Model):
     slug = models.SlugField(
         max_length=200,
         unique=True,
-        db_index=True,
         help_text='Уникальный слаг тэга'
     )
 
@@ -85,6 +89,17 @@ class Tag(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def all_cached(cls):
+        """Возвращает все тэги, загружая их из базы один раз на процесс."""
+        if 'all' not in _TAG_CACHE:
+            _TAG_CACHE['all'] = list(cls.objects.all())
+        return _TAG_CACHE['all']
+
+    @classmethod
+    def clear_cache(cls):
+        _TAG_CACHE.clear()
+
 
 class QuerySet(models.QuerySet):
     """
@@ -93,6 +108,15 @@ class QuerySet(models.QuerySet):
     """
 
     def add_annotations(self, user_id):
+        if user_id is None:
+            return self.annotate(
+                is_favorited=models.Value(
+                    False, output_field=models.BooleanField()
+                ),
+                is_in_shopping_cart=models.Value(
+                    False, output_field=models.BooleanField()
+                ),
+            )
         return self.annotate(
             is_favorited=models.Exists(
                 Favorite.objects.filter(
@@ -108,6 +132,16 @@ class QuerySet(models.QuerySet):
             ),
         )
 
+    def with_related(self):
+        """Подгружает автора, тэги и ингредиенты рецептов заранее."""
+        return self.select_related('author').prefetch_related(
+            'tags',
+            models.Prefetch(
+                'ingredients_amount',
+                queryset=IngredientAmount.objects.select_related('ingredient')
+            ),
+        )
+
 
 class Recipe(models.Model):
     """Модель рецептов."""
@@ -164,6 +198,19 @@ class Recipe(models.Model):
         auto_now_add=True,
         verbose_name='Дата публикации'
     )
+    favorites_count = models.PositiveIntegerField(
+        default=0,
+        db_index=True,
+        editable=False,
+        verbose_name='Добавлено в избранное'
+    )
+    shopping_cart_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Добавлено в списки покупок'
+    )
+
+    COUNTER_FIELDS = ('favorites_count', 'shopping_cart_count')
 
     objects = QuerySet.as_manager()
 
@@ -181,10 +228,49 @@ class Recipe(models.Model):
                 name='\n%(app_label)s_%(class)s_name - пустое значение\n',
             ),
         )
+        indexes = (
+            models.Index(
+                fields=('-pub_date',),
+                name='recipe_pubdate_desc_idx'
+            ),
+            models.Index(
+                fields=('author', '-pub_date'),
+                name='recipe_author_pubdate_idx'
+            ),
+        )
 
     def __str__(self):
         return f'{self.name} от {self.author.username}'
 
+    def save(self, *args, **kwargs):
+        """
+        Не перезаписывает счетчики при сохранении существующего рецепта:
+        они изменяются только атомарно из сигналов избранного и покупок.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+
+class IngredientAmountQuerySet(models.QuerySet):
+    """Запросы к ингредиентам рецептов."""
+
+    def shopping_list(self, user):
+        """
+        Суммирует количество ингредиентов по всем рецептам из списка
+        покупок пользователя.
+        """
+        return self.filter(recipe__shopping_cart__user=user).values(
+            name=models.F('ingredient__name'),
+            measurement_unit=models.F('ingredient__measurement_unit'),
+        ).annotate(
+            amount=models.Sum('amount')
+        ).order_by('name')
+
 
 class IngredientAmount(models.Model):
     """Модель, определяющая количество ингредиентов в рецепте."""
@@ -216,8 +302,9 @@ class IngredientAmount(models.Model):
         ],
     )
 
+    objects = IngredientAmountQuerySet.as_manager()
+
     class Meta:
-        ordering = ('-id',)
         verbose_name = 'Ингредиент'
         verbose_name_plural = 'Ингредиенты рецепта'
         constraints = (
@@ -226,10 +313,30 @@ class IngredientAmount(models.Model):
                 name='unique_ingredients_recipe'
             ),
         )
+        indexes = (
+            models.Index(
+                fields=('recipe', 'ingredient'),
+                name='amount_recipe_ingredient_idx'
+            ),
+        )
 
     def __str__(self):
         return f'{self.ingredient}: {self.amount}'
 
+    @classmethod
+    def bulk_set_for_recipe(cls, recipe, ingredients):
+        """
+        Заменяет ингредиенты рецепта. Принимает пары (ингредиент, количество)
+        и сохраняет их одним запросом.
+        """
+        cls.objects.filter(recipe=recipe).delete()
+        cls.objects.bulk_create(
+            [cls(recipe=recipe, ingredient=ingredient, amount=amount)
+             for ingredient, amount in ingredients],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
 
 class Favorite(models.Model):
     """Модель для хранения избранных рецептов."""
@@ -242,6 +349,7 @@ class Favorite(models.Model):
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
+        db_index=False,
         related_name='favorite',
         verbose_name='Пользователь',
     )
@@ -253,7 +361,7 @@ class Favorite(models.Model):
     )
 
     class Meta:
-        ordering = ('user',)
+        ordering = ('-id',)
         verbose_name = 'Избранное'
         verbose_name_plural = 'Избранные'
         constraints = (
@@ -262,6 +370,9 @@ class Favorite(models.Model):
                 name='unique_for_favorite'
             ),
         )
+        indexes = (
+            models.Index(fields=('user', '-id'), name='fav_user_idx'),
+        )
 
 
 class ShoppingCart(models.Model):
@@ -275,6 +386,7 @@ class ShoppingCart(models.Model):
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
+        db_index=False,
         related_name='shopping_cart',
         verbose_name='Пользователь',
     )
@@ -295,3 +407,6 @@ class ShoppingCart(models.Model):
                 name='unique_shopping_cart'
             ),
         )
+        indexes = (
+            models.Index(fields=('user', '-id'), name='cart_user_idx'),
+        )
@@ -0,0 +1,39 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Favorite, Recipe, ShoppingCart, Tag
+
+COUNTERS = {
+    Favorite: 'favorites_count',
+    ShoppingCart: 'shopping_cart_count',
+}
+
+
+def update_counter(instance, delta):
+    """Атомарно изменяет счетчик рецепта, связанный с моделью instance."""
+    field = COUNTERS[type(instance)]
+    Recipe.objects.filter(pk=instance.recipe_id).update(
+        **{field: F(field) + delta}
+    )
+
+
+@receiver((post_save, post_delete), sender=Tag)
+def clear_tag_cache(sender, **kwargs):
+    """Сбрасывает кэш тэгов при их изменении или удалении."""
+    Tag.clear_cache()
+
+
+@receiver(post_save, sender=Favorite)
+@receiver(post_save, sender=ShoppingCart)
+def increase_counter(sender, instance, created, raw, **kwargs):
+    """Увеличивает счетчик рецепта при добавлении в избранное/покупки."""
+    if created and not raw:
+        update_counter(instance, 1)
+
+
+@receiver(post_delete, sender=Favorite)
+@receiver(post_delete, sender=ShoppingCart)
+def decrease_counter(sender, instance, **kwargs):
+    """Уменьшает счетчик рецепта при удалении из избранного/покупок."""
+    update_counter(instance, -1)
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.19 on 2026-10-15 13:30
+
+from django.db import migrations
+
+
+def grant_staff_to_admins(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    User.objects.filter(role='admin').update(is_staff=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_follow_unique_follow'),
+    ]
+
+    operations = [
+        migrations.RunPython(grant_staff_to_admins, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='user',
+            name='role',
+        ),
+    ]
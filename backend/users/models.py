@@ -8,16 +8,6 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ('username', 'first_name', 'last_name',)
 
-    GUEST = 'guest'
-    AUTHORIZED = 'authorized'
-    ADMIN = 'admin'
-
-    USER_ROLES = [
-        (GUEST, 'guest'),
-        (AUTHORIZED, 'authorized'),
-        (ADMIN, 'admin'),
-    ]
-
     email = models.EmailField(
         max_length=254,
         unique=True,
@@ -25,17 +15,10 @@ class User(AbstractUser):
         help_text='Обязательно для заполнения. '
     )
 
-    role = models.CharField(
-        default='guest',
-        choices=USER_ROLES,
-        max_length=10,
-        verbose_name='Уровень доступа пользователей',
-    )
-
     @property
     def is_admin(self):
         """Проверка наличия прав администратора/суперпользователя."""
-        return self.role == self.ADMIN or self.is_superuser
+        return self.is_staff or self.is_superuser
 
     class Meta:
         ordering = ('id',)